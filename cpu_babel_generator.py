@@ -5,388 +5,539 @@ Generates Verilog for simplified x86-64-inspired cores based on seeded PRNG para
 Supports phases: generation, search, verification.
 """
 
+import asyncio
+import functools
+import itertools
+import logging
 import random
 import hashlib
 import os
 import subprocess
 import sys
-from typing import Dict, List, Tuple, Any
+import types
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Mapping, Tuple, Any
+
+import jinja2
+import numpy as np
+
+try:
+    import xxhash  # optional: ~10x faster than cryptographic hashes here
+except ImportError:
+    xxhash = None
+
+try:
+    import numba  # optional: JIT-compiles the search distance kernel
+except ImportError:
+    numba = None
+
+# Library code logs instead of printing: a sweep generating thousands of
+# candidates can silence the per-candidate chatter (and its stdout flushes)
+# by lowering the level, while the CLI enables INFO in main().
+log = logging.getLogger(__name__)
 
 class MicroX86Params:
     """Parameters for micro-x86-64 ISA and microarchitecture."""
     
-    # ISA Parameters
-    NUM_REGS_OPTIONS = [4, 6, 8]
-    REG_NAMES = ['RAX', 'RBX', 'RCX', 'RDX', 'R8', 'R9', 'R10', 'R11']  # First 8 for mapping
-    
-    INSTRUCTIONS = [
+    # ISA Parameters (tuples: immutable, cheap for random.choice, and safe to
+    # share across ProcessPoolExecutor workers without copy-on-write surprises)
+    NUM_REGS_OPTIONS = (4, 6, 8)
+    REG_NAMES = ('RAX', 'RBX', 'RCX', 'RDX', 'R8', 'R9', 'R10', 'R11')  # First 8 for mapping
+
+    INSTRUCTIONS = (
         'ADD', 'SUB', 'AND', 'OR', 'XOR', 'INC', 'DEC',
         'MOV', 'JMP', 'CMP', 'JE', 'JNE', 'PUSH', 'POP'
-    ]
-    
-    ADDRESSING_MODES = [1, 2, 3]  # 1: [reg], 2: [reg+imm], 3: [reg+reg]
-    
+    )
+
+    ADDRESSING_MODES = (1, 2, 3)  # 1: [reg], 2: [reg+imm], 3: [reg+reg]
+
     # Microarchitecture Parameters
-    DECODER_TYPES = ['hardwired', 'microcoded']
-    PIPELINE_DEPTHS = [2, 3, 4]
-    EXEC_UNITS = ['single_alu', 'separate_agu_alu']
-    MEMORY_TYPES = ['simple', 'cached']  # cached: small I-cache
-    
-    # Lexicon for search
-    LEXICON = {
-        'cisc': {'decoder': 'microcoded'},
-        'risc_like': {'decoder': 'hardwired'},
-        'compact': {'num_regs': 4, 'addressing_modes': [1]},
-        'powerful': {'num_regs': 8, 'addressing_modes': [1,2,3]},
-        'fast_memory': {'memory': 'cached'},
-        'simple_memory': {'memory': 'simple'},
-        'deep_pipeline': {'pipeline_depth': 4},
-        'shallow_pipeline': {'pipeline_depth': 2}
+    DECODER_TYPES = ('hardwired', 'microcoded')
+    PIPELINE_DEPTHS = (2, 3, 4)
+    EXEC_UNITS = ('single_alu', 'separate_agu_alu')
+    MEMORY_TYPES = ('simple', 'cached')  # cached: small I-cache
+
+    # Lexicon for search (read-only so queries can never corrupt it)
+    LEXICON = types.MappingProxyType({
+        'cisc': types.MappingProxyType({'decoder': 'microcoded'}),
+        'risc_like': types.MappingProxyType({'decoder': 'hardwired'}),
+        'compact': types.MappingProxyType({'num_regs': 4, 'addressing_modes': (1,)}),
+        'powerful': types.MappingProxyType({'num_regs': 8, 'addressing_modes': (1, 2, 3)}),
+        'fast_memory': types.MappingProxyType({'memory': 'cached'}),
+        'simple_memory': types.MappingProxyType({'memory': 'simple'}),
+        'deep_pipeline': types.MappingProxyType({'pipeline_depth': 4}),
+        'shallow_pipeline': types.MappingProxyType({'pipeline_depth': 2})
+    })
+
+# Canonical key order for parameter fingerprints. The parameter domain is
+# tiny and enumerable, so every legal (key, value) pair is assigned a small
+# integer code at import time; a set of params then becomes a fixed-width
+# int8 vector and similarity_search reduces to vectorized NumPy arithmetic.
+FINGERPRINT_KEYS = ('num_regs', 'addressing_modes', 'decoder_type',
+                    'pipeline_depth', 'exec_units', 'memory_type')
+
+# The 7 nonempty subsets of ADDRESSING_MODES, indexed by (3-bit mask - 1).
+# One randrange over this table replaces a randint + sample pair in
+# seed_to_params, and the index doubles as the subset's fingerprint code.
+_ADDR_SUBSETS = tuple(
+    tuple(m for i, m in enumerate(MicroX86Params.ADDRESSING_MODES) if (bits >> i) & 1)
+    for bits in range(1, 1 << len(MicroX86Params.ADDRESSING_MODES)))
+
+def _build_code_table() -> Dict[Tuple[str, Any], int]:
+    """Enumerate every legal (param_key, value) pair into a small int code."""
+    domains = {
+        'num_regs': MicroX86Params.NUM_REGS_OPTIONS,
+        'addressing_modes': _ADDR_SUBSETS,
+        'decoder_type': MicroX86Params.DECODER_TYPES,
+        'pipeline_depth': MicroX86Params.PIPELINE_DEPTHS,
+        'exec_units': MicroX86Params.EXEC_UNITS,
+        'memory_type': MicroX86Params.MEMORY_TYPES,
     }
+    table = {}
+    for key in FINGERPRINT_KEYS:
+        for code, value in enumerate(domains[key]):
+            table[(key, value)] = code
+    return table
+
+CODE_TABLE: Dict[Tuple[str, Any], int] = _build_code_table()
+
+# Lexicon entries use shorthand keys; map them onto the fingerprint axes.
+_LEXICON_PARAM_KEYS = {'decoder': 'decoder_type', 'memory': 'memory_type'}
+
+def params_to_fingerprint(params: Dict[str, Any]) -> np.ndarray:
+    """Encode params as a fixed-width int8 vector of CODE_TABLE codes."""
+    codes = []
+    for key in FINGERPRINT_KEYS:
+        value = params[key]
+        if key == 'addressing_modes':
+            value = tuple(sorted(value))
+        codes.append(CODE_TABLE[(key, value)])
+    return np.array(codes, dtype=np.int8)
+
+def _encode_query(target_params: Dict[str, Any]) -> np.ndarray:
+    """Encode lexicon target params as an int8 vector, -1 for unspecified keys."""
+    query = np.full(len(FINGERPRINT_KEYS), -1, dtype=np.int8)
+    for key, value in target_params.items():
+        key = _LEXICON_PARAM_KEYS.get(key, key)
+        if key not in FINGERPRINT_KEYS:
+            continue
+        if key == 'addressing_modes':
+            value = tuple(sorted(value))
+        query[FINGERPRINT_KEYS.index(key)] = CODE_TABLE[(key, value)]
+    return query
+
+@functools.lru_cache(maxsize=4096)
+def seed_to_params(seed: str) -> Mapping[str, Any]:
+    """Convert seed to parameters using PRNG.
+
+    The mapping is pure, so results are memoized; the returned mapping is
+    read-only so cached entries cannot be corrupted by callers.
+    """
+    # A dedicated Random instance seeds straight from the string, skipping
+    # the old MD5 digest + hex round-trip and leaving global random state alone.
+    rng = random.Random(seed)
 
-def seed_to_params(seed: str) -> Dict[str, Any]:
-    """Convert seed to parameters using PRNG."""
-    random.seed(int(hashlib.md5(seed.encode()).hexdigest(), 16))
-    
     params = {
-        'num_regs': random.choice(MicroX86Params.NUM_REGS_OPTIONS),
-        'addressing_modes': random.sample(MicroX86Params.ADDRESSING_MODES, 
-                                        k=random.randint(1, len(MicroX86Params.ADDRESSING_MODES))),
-        'decoder_type': random.choice(MicroX86Params.DECODER_TYPES),
-        'pipeline_depth': random.choice(MicroX86Params.PIPELINE_DEPTHS),
-        'exec_units': random.choice(MicroX86Params.EXEC_UNITS),
-        'memory_type': random.choice(MicroX86Params.MEMORY_TYPES),
+        'num_regs': rng.choice(MicroX86Params.NUM_REGS_OPTIONS),
+        'addressing_modes': _ADDR_SUBSETS[rng.randrange(len(_ADDR_SUBSETS))],
+        'decoder_type': rng.choice(MicroX86Params.DECODER_TYPES),
+        'pipeline_depth': rng.choice(MicroX86Params.PIPELINE_DEPTHS),
+        'exec_units': rng.choice(MicroX86Params.EXEC_UNITS),
+        'memory_type': rng.choice(MicroX86Params.MEMORY_TYPES),
         'instructions': MicroX86Params.INSTRUCTIONS  # Fixed for now
     }
-    return params
+    return types.MappingProxyType(params)
+
+@functools.lru_cache(maxsize=4096)
+def seed_to_fingerprint(seed: str) -> np.ndarray:
+    """Fingerprint of a seed's params, memoized alongside seed_to_params."""
+    fingerprint = params_to_fingerprint(seed_to_params(seed))
+    fingerprint.setflags(write=False)
+    return fingerprint
+
+# Options must match between the runtime Environment and the AOT compile
+# below, or precompiled templates would render differently from source ones.
+_ENV_OPTIONS = dict(
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+)
+
+# The Verilog templates live in templates/*.v.j2 so the Python parser never
+# tokenizes them at import time; Jinja compiles them on first use and stores
+# the bytecode on disk so later processes skip parsing too.
+_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+_TEMPLATE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.jinja_cache')
+_BYTECODE_CACHE_DIR = os.path.join(os.path.expanduser('~/.cache'), 'cpu_babel', 'jinja')
+
+def _bytecode_cache() -> 'jinja2.FileSystemBytecodeCache | None':
+    """Persistent template bytecode cache, or None if the dir is unusable."""
+    try:
+        os.makedirs(_BYTECODE_CACHE_DIR, exist_ok=True)
+    except OSError:
+        return None
+    return jinja2.FileSystemBytecodeCache(directory=_BYTECODE_CACHE_DIR)
+
+def _make_env() -> jinja2.Environment:
+    """Build the template Environment, preferring AOT-compiled templates.
+
+    compile_template_cache() writes the templates out as importable Python
+    modules; when that cache exists, ModuleLoader skips template parsing
+    entirely at startup, which matters for shell sweeps invoking the CLI in
+    a loop. Otherwise templates load from templates/ and their compiled
+    bytecode is persisted, so only the very first process pays the parse.
+    """
+    loader = jinja2.FileSystemLoader(_TEMPLATE_DIR, followlinks=False)
+    if os.path.isdir(_TEMPLATE_CACHE_DIR):
+        loader = jinja2.ChoiceLoader([jinja2.ModuleLoader(_TEMPLATE_CACHE_DIR), loader])
+    return jinja2.Environment(loader=loader, cache_size=-1, auto_reload=False,
+                              bytecode_cache=_bytecode_cache(), **_ENV_OPTIONS)
+
+def compile_template_cache(target_dir: str = _TEMPLATE_CACHE_DIR) -> str:
+    """AOT-compile the Verilog templates so later processes skip parsing."""
+    env = jinja2.Environment(loader=jinja2.FileSystemLoader(_TEMPLATE_DIR), **_ENV_OPTIONS)
+    os.makedirs(target_dir, exist_ok=True)
+    env.compile_templates(target_dir, zip=None)
+    return target_dir
+
+# One Environment per process: compiled templates are cached inside it
+# (cache_size=-1 disables eviction), so every seed after the first reuses
+# the compiled bytecode instead of reparsing the template source.
+_ENV = _make_env()
 
 def generate_register_file_verilog(params: Dict[str, Any]) -> str:
     """Generate Verilog for register file."""
-    num_regs = params['num_regs']
-    reg_width = 64
-    template = f"""
-module reg_file #(
-    parameter NUM_REGS = {num_regs},
-    parameter REG_WIDTH = {reg_width}
-)(
-    input clk,
-    input we,  // write enable
-    input [${{NUM_REGS-1}}:0] waddr,  // write address
-    input [${{NUM_REGS-1}}:0] raddr1, raddr2,
-    input [REG_WIDTH-1:0] wdata,
-    output [REG_WIDTH-1:0] rdata1, rdata2
-);
-    reg [REG_WIDTH-1:0] regs [0:NUM_REGS-1];
-    
-    integer i;
-    initial begin
-        for (i = 0; i < NUM_REGS; i = i + 1) begin
-            regs[i] = 64'h0;
-        end
-    end
-    
-    always @(posedge clk) begin
-        if (we) begin
-            regs[waddr] <= wdata;
-        end
-    end
-    
-    assign rdata1 = regs[raddr1];
-    assign rdata2 = regs[raddr2];
-endmodule
-"""
-    return template
+    return _ENV.get_template('reg_file.v.j2').render(num_regs=params['num_regs'], reg_width=64)
 
 def generate_decoder_verilog(params: Dict[str, Any]) -> str:
     """Generate Verilog for instruction decoder."""
-    decoder_type = params['decoder_type']
-    if decoder_type == 'hardwired':
-        template = """
-module decoder_hardwired (
-    input [31:0] instr,
-    output reg [3:0] opcode,  // Simplified 4-bit opcode
-    output reg [2:0] dest_reg,
-    output reg [2:0] src1_reg,
-    output reg [3:0] mode,  // Addressing mode
-    output reg [13:0] imm  // Immediate
-);
-    // Hardwired decoding logic
-    always @(*) begin
-        opcode = instr[31:28];
-        dest_reg = instr[27:25];
-        src1_reg = instr[24:22];
-        mode = instr[21:18];
-        imm = instr[17:4];
-    end
-endmodule
-"""
-    else:  # microcoded
-        template = """
-module decoder_microcoded (
-    input [31:0] instr,
-    input clk,
-    output reg [15:0] micro_addr,  // Microcode address
-    output reg micro_we
-);
-    // Simple microcode ROM (generated separately)
-    reg [31:0] micro_rom [0:255];  // 256 entries, 32-bit microinstructions
-    
-    initial begin
-        // Microcode initialization would be populated by generator
-        // For now, placeholder
-        micro_rom[0] = 32'hDEADBEEF;  // Example
-    end
-    
-    always @(*) begin
-        // Decode to micro-op address
-        micro_addr = instr[15:0];  // Simplified
-        micro_we = 1'b0;
-    end
-endmodule
-"""
-    return template
+    name = 'decoder_hw.v.j2' if params['decoder_type'] == 'hardwired' else 'decoder_mc.v.j2'
+    return _ENV.get_template(name).render()
 
 def generate_alu_verilog(params: Dict[str, Any]) -> str:
     """Generate Verilog for ALU."""
-    exec_units = params['exec_units']
-    if exec_units == 'single_alu':
-        template = """
-module alu (
-    input [3:0] op,
-    input [63:0] a, b,
-    output reg [63:0] result,
-    output reg zero_flag
-);
-    always @(*) begin
-        case (op)
-            4'h1: result = a + b;  // ADD
-            4'h2: result = a - b;  // SUB
-            4'h3: result = a & b;  // AND
-            4'h4: result = a | b;  // OR
-            4'h5: result = a ^ b;  // XOR
-            default: result = a;
-        endcase
-        zero_flag = (result == 64'h0);
-    end
-endmodule
-"""
-    else:  # separate_agu_alu
-        template = """
-module agu_alu_separate (
-    input [3:0] op,
-    input [63:0] a, b,
-    input is_memory_op,
-    output reg [63:0] result,
-    output reg [63:0] addr_calc,
-    output reg zero_flag
-);
-    // ALU part
-    always @(*) begin
-        if (is_memory_op) begin
-            addr_calc = a + b;  // Address generation
-            result = 64'h0;
-        end else begin
-            case (op)
-                4'h1: result = a + b;
-                // ... other ops
-                default: result = a;
-            endcase
-            addr_calc = 64'h0;
-        end
-        zero_flag = (result == 64'h0);
-    end
-endmodule
-"""
-    return template
+    name = 'alu_single.v.j2' if params['exec_units'] == 'single_alu' else 'alu_agu.v.j2'
+    return _ENV.get_template(name).render()
 
 def generate_memory_interface_verilog(params: Dict[str, Any]) -> str:
     """Generate Verilog for memory interface."""
-    memory_type = params['memory_type']
-    if memory_type == 'simple':
-        template = """
-module memory_simple (
-    input clk,
-    input [63:0] addr,
-    input [63:0] wdata,
-    input we,
-    output reg [63:0] rdata
-);
-    reg [63:0] mem [0:1023];  // Small memory 1KB
-    
-    always @(posedge clk) begin
-        if (we) begin
-            mem[addr[9:0]] <= wdata;  // Simplified addressing
-        end
-        rdata <= mem[addr[9:0]];
-    end
-endmodule
-"""
-    else:  # cached
-        template = """
-module memory_cached (
-    input clk,
-    input [63:0] addr,
-    input [63:0] wdata,
-    input we,
-    output reg [63:0] rdata,
-    output reg hit
-);
-    // Simple direct-mapped I-cache, 16 entries, 4 words each
-    reg [63:0] cache_data [0:15][0:3];
-    reg [63:0] cache_tags [0:15];
-    reg [3:0] valid [0:15];
-    
-    // Simplified cache logic (placeholder)
-    always @(*) begin
-        // Cache hit/miss logic here
-        hit = 1'b1;  // Assume hit for simplicity
-        rdata = cache_data[addr[7:4]][addr[3:2]];
-    end
-endmodule
-"""
-    return template
+    name = 'mem_simple.v.j2' if params['memory_type'] == 'simple' else 'mem_cached.v.j2'
+    return _ENV.get_template(name).render()
+
+def _canonical_params_key(params: Mapping[str, Any]) -> bytes:
+    """Stable byte key for a param set, independent of dict and value ordering."""
+    items = []
+    for key in sorted(params):
+        value = params[key]
+        if isinstance(value, list):
+            value = tuple(value)
+        items.append((key, value))
+    return repr(items).encode()
+
+def _filename_hash(canonical_key: bytes) -> str:
+    """8-hex-char content hash for output filenames.
+
+    Collision resistance is irrelevant for 32 bits of filename entropy, so
+    prefer xxh32 when installed and fall back to BLAKE2b, which beats MD5
+    without the OpenSSL dispatch overhead.
+    """
+    if xxhash is not None:
+        return xxhash.xxh32(canonical_key).hexdigest()
+    return hashlib.blake2b(canonical_key, digest_size=4).hexdigest()
 
-def generate_top_level_verilog(params: Dict[str, Any], output_dir: str = '.') -> str:
-    """Generate top-level Verilog module."""
-    num_regs = params['num_regs']
-    pipeline_depth = params['pipeline_depth']
+@functools.lru_cache(maxsize=None)
+def _render_top(num_regs: int, addressing_modes: Tuple[int, ...], pipeline_depth: int,
+                decoder_type: str, exec_units: str, memory_type: str) -> str:
+    """Render the full core for one configuration.
+
+    The configuration space is only 3 x 7 x 3 x 2 x 2 x 2 = 504 points, so
+    the cache saturates almost immediately and sweep iterations after the
+    first become dict lookups.
+    """
     reg_names = MicroX86Params.REG_NAMES[:num_regs]
-    
+
     # Include other modules
     verilog_parts = [
-        generate_register_file_verilog(params),
-        generate_decoder_verilog(params),
-        generate_alu_verilog(params),
-        generate_memory_interface_verilog(params)
+        generate_register_file_verilog({'num_regs': num_regs}),
+        generate_decoder_verilog({'decoder_type': decoder_type}),
+        generate_alu_verilog({'exec_units': exec_units}),
+        generate_memory_interface_verilog({'memory_type': memory_type})
     ]
-    
-    top_template = f"""
-// Top-level micro-x86-64 core
-// Parameters: {{params}}
-
-{{chr(10).join(verilog_parts)}}
-
-module micro_x86_core #(
-    parameter NUM_REGS = {num_regs},
-    parameter PIPELINE_DEPTH = {pipeline_depth}
-)(
-    input clk,
-    input reset,
-    input [31:0] instr,  // From fetch stage
-    output [63:0] pc_out
-);
-
-    wire [63:0] rdata1, rdata2;
-    wire [3:0] opcode;
-    wire [2:0] dest_reg, src1_reg;
-    wire [3:0] mode;
-    wire [13:0] imm;
-    wire [63:0] alu_result;
-    wire zero_flag;
-    
-    // Instantiate components based on params
-    reg_file #(.NUM_REGS(NUM_REGS)) rf (
-        .clk(clk),
-        .we(/* from control */),
-        .waddr(dest_reg),
-        .raddr1(src1_reg),
-        .raddr2(/* src2 */),
-        .wdata(alu_result),
-        .rdata1(rdata1),
-        .rdata2(rdata2)
-    );
-    
-    decoder_{params['decoder_type']} dec (
-        .instr(instr),
-        .opcode(opcode),
-        .dest_reg(dest_reg),
-        .src1_reg(src1_reg),
-        .mode(mode),
-        .imm(imm)
-    );
-    
-    alu alu_inst (
-        .op(opcode[3:0]),
-        .a(rdata1),
-        .b(/* src2 or imm */),
-        .result(alu_result),
-        .zero_flag(zero_flag)
-    );
-    
-    memory_{params['memory_type']} mem_inst (
-        .clk(clk),
-        .addr(/* effective addr */),
-        .wdata(rdata1),
-        .we(/* control */),
-        .rdata(/* to reg */)
-    );
-    
-    // Pipeline registers for {{pipeline_depth}} stages (simplified)
-    reg [63:0] pipeline_regs [{pipeline_depth}][/* width */];
-    
-    // PC logic
-    reg [63:0] pc;
-    always @(posedge clk) begin
-        if (reset) pc <= 64'h0;
-        else pc <= pc + 32'd4;  // Assume 32-bit instr
-    end
-    assign pc_out = pc;
-    
-    // Register names for simulation: {', '.join(reg_names)}
-    
-endmodule
-"""
-    
-    filename = os.path.join(output_dir, f"micro_x86_core_{hashlib.md5(str(params).encode()).hexdigest()[:8]}.v")
-    with open(filename, 'w') as f:
-        f.write(top_template)
-    print(f"Generated Verilog: {filename}")
-    return filename
+
+    shown_params = {
+        'num_regs': num_regs,
+        'addressing_modes': addressing_modes,
+        'decoder_type': decoder_type,
+        'pipeline_depth': pipeline_depth,
+        'exec_units': exec_units,
+        'memory_type': memory_type,
+    }
+
+    return _ENV.get_template('top.v.j2').render(
+        params=shown_params,
+        verilog_parts='\n'.join(verilog_parts),
+        num_regs=num_regs,
+        pipeline_depth=pipeline_depth,
+        decoder_type=decoder_type,
+        memory_type=memory_type,
+        reg_names=', '.join(reg_names)
+    )
+
+def generate_top_level_verilog(params: Dict[str, Any], output_dir: str = '.',
+                               write: bool = True) -> Tuple[str, str]:
+    """Generate top-level Verilog module; returns (verilog_text, filename).
+
+    With write=False the text is only rendered, so verification can pipe it
+    straight to Yosys without touching the disk.
+    """
+    top_template = _render_top(params['num_regs'], tuple(params['addressing_modes']),
+                               params['pipeline_depth'], params['decoder_type'],
+                               params['exec_units'], params['memory_type'])
+
+    # Hash a canonical key, not str(params): equal params always land in the
+    # same file regardless of dict ordering or list/tuple representation.
+    # That makes the filename content-addressed, so a sweep hitting the same
+    # configuration twice skips the rewrite (at most 504 writes per output dir).
+    file_hash = _filename_hash(_canonical_params_key(params))
+    filename = os.path.join(output_dir, f"micro_x86_core_{file_hash}.v")
+    if write and not os.path.exists(filename):
+        with open(filename, 'w') as f:
+            f.write(top_template)
+        log.info("Generated Verilog: %s", filename)
+    return top_template, filename
+
+def enumerate_all_configs() -> Iterator[Dict[str, Any]]:
+    """Yield every legal parameter combination - the library's whole universe.
+
+    Seeds only ever map into this space (504 configurations), so a sweep can
+    generate it once up front and afterwards resolve any seed to its prebuilt
+    file instead of re-rendering per seed.
+    """
+    combos = itertools.product(
+        MicroX86Params.NUM_REGS_OPTIONS, _ADDR_SUBSETS,
+        MicroX86Params.DECODER_TYPES, MicroX86Params.PIPELINE_DEPTHS,
+        MicroX86Params.EXEC_UNITS, MicroX86Params.MEMORY_TYPES)
+    for num_regs, addressing_modes, decoder_type, pipeline_depth, exec_units, memory_type in combos:
+        yield {
+            'num_regs': num_regs,
+            'addressing_modes': addressing_modes,
+            'decoder_type': decoder_type,
+            'pipeline_depth': pipeline_depth,
+            'exec_units': exec_units,
+            'memory_type': memory_type,
+            'instructions': MicroX86Params.INSTRUCTIONS  # Fixed for now
+        }
+
+def pregenerate_all(output_dir: str = '.') -> List[str]:
+    """Emit a Verilog file for every configuration; returns the filenames.
+
+    Content-addressed filenames mean re-running is idempotent, and any
+    later per-seed request hits an existing file via the dedup check in
+    generate_top_level_verilog.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    filenames = [generate_top_level_verilog(config, output_dir)[1]
+                 for config in enumerate_all_configs()]
+    log.info("Pregenerated %d configurations in %s", len(filenames), output_dir)
+    return filenames
+
+# Below this many candidates, process-pool startup and pickling cost more
+# than the fingerprinting they would parallelize.
+_PARALLEL_SEARCH_THRESHOLD = 1024
+
+def _fingerprint(seed: str) -> Tuple[str, np.ndarray]:
+    """Fingerprint one seed; top-level so ProcessPoolExecutor can pickle it."""
+    return seed, seed_to_fingerprint(seed)
+
+@functools.lru_cache(maxsize=64)
+def _fingerprint_table(seeds: Tuple[str, ...]) -> np.ndarray:
+    """Stack fingerprints for a candidate pool, fanning out for large pools.
+
+    Memoized on the seed tuple so repeated queries over the same pool reuse
+    the stacked array instead of rebuilding it per query.
+    """
+    if len(seeds) >= _PARALLEL_SEARCH_THRESHOLD:
+        # seed_to_params is pure with no shared state, so the sweep scales
+        # near-linearly across cores; chunking amortizes the IPC pickle cost.
+        chunksize = max(1, len(seeds) // (4 * (os.cpu_count() or 1)))
+        with ProcessPoolExecutor() as executor:
+            rows = [fp for _, fp in executor.map(_fingerprint, seeds, chunksize=chunksize)]
+    else:
+        rows = [seed_to_fingerprint(seed) for seed in seeds]
+    table = np.stack(rows)
+    table.setflags(write=False)
+    return table
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _batch_distance_jit(table, query, mask):
+        out = np.empty(table.shape[0], dtype=np.int64)
+        for s in numba.prange(table.shape[0]):
+            acc = 0
+            for k in range(table.shape[1]):
+                if mask[k]:
+                    acc += abs(int(table[s, k]) - int(query[k]))
+            out[s] = acc
+        return out
+
+def _batch_distance(table: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Masked Manhattan distance from each candidate row to the query.
+
+    The tight int8 loop vectorizes well under Numba (prange over candidates,
+    SIMD absolute differences), so very large pools use the JIT kernel when
+    numba is installed; otherwise NumPy broadcasting does the same pass.
+    """
+    if numba is not None and len(table) >= _PARALLEL_SEARCH_THRESHOLD:
+        return _batch_distance_jit(table, query, query >= 0)
+    return np.where(query >= 0, np.abs(table - query), 0).sum(axis=1)
 
 def similarity_search(seeds: List[str], query_words: List[str], max_results: int = 5) -> List[Tuple[str, float]]:
     """Phase 3: Similarity search using lexicon."""
+    if not seeds:
+        return []
+
     target_params = {}
     for word in query_words:
         if word in MicroX86Params.LEXICON:
             for k, v in MicroX86Params.LEXICON[word].items():
                 target_params[k] = v
     
-    results = []
-    for seed in seeds:
-        gen_params = seed_to_params(seed)
-        # Simple Euclidean distance on params (simplified)
-        distance = 0.0
-        for k in target_params:
-            if k in gen_params:
-                # Normalize and compute diff (placeholder)
-                distance += abs(hash(str(gen_params[k])) % 100 - hash(str(target_params[k])) % 100)
-        results.append((seed, distance))
-    
-    results.sort(key=lambda x: x[1])
-    return results[:max_results]
+    query = _encode_query(target_params)
+    table = _fingerprint_table(tuple(seeds))
+    dist = _batch_distance(table, query)
+
+    # Top-K via argpartition (O(S)) instead of a full sort, then order just
+    # the K winners; ties resolve by candidate position as before.
+    k = min(max_results, len(dist))
+    if k == 0:
+        return []
+    idx = np.argpartition(dist, k - 1)[:k]
+    idx = idx[np.lexsort((idx, dist[idx]))]
+    return [(seeds[i], float(dist[i])) for i in idx]
 
-def verify_verilog(verilog_file: str) -> bool:
+def _verify_script(verilog_text: str) -> str:
+    """One-shot Yosys script: heredoc the Verilog, then check and synthesize."""
+    # Feeding the text over a heredoc avoids any temp file on disk, and the
+    # syntax check + synthesis estimate share one process instead of two.
+    return ('read_verilog <<EOT\n' + verilog_text + '\nEOT\n'
+            'hierarchy -check; synth -top micro_x86_core; abc; stat')
+
+def verify_verilog(verilog_text: str) -> bool:
     """Phase 4: Basic verification with Yosys and Verilator stubs."""
-    try:
-        # Syntax check with Yosys
-        subprocess.run(['yosys', '-p', f'read_verilog {verilog_file}; hierarchy -check;'], 
-                       check=True, capture_output=True)
-        print("Syntax check passed.")
-        
-        # Synthesis size estimate
-        synth_cmd = f'yosys -p "read_verilog {verilog_file}; synth -top micro_x86_core; abc; stat"'
-        result = subprocess.run(synth_cmd, shell=True, capture_output=True, text=True)
-        print("Synthesis:", result.stdout)
-        if "Error" in result.stderr:
+    # Plain argv, no shell wrapper: lets CPython take its cheap spawn path
+    # (posix_spawn/vfork) instead of forking an intermediate /bin/sh.
+    result = subprocess.run(['yosys', '-p', _verify_script(verilog_text)],
+                            stdin=subprocess.DEVNULL, capture_output=True)
+    if result.returncode != 0:
+        log.warning("Verification failed.")
+        return False
+    log.info("Syntax check passed.")
+    if log.isEnabledFor(logging.DEBUG):
+        # stdout can be kilobytes of synth stats; skip the decode unless
+        # somebody will actually read it
+        log.debug("Synthesis: %s", result.stdout.decode(errors='replace'))
+
+    # Simulation stub (requires test program)
+    # subprocess.run(['verilator', '--cc', verilog_file, '--exe', 'test.cpp'], check=True)
+    log.info("Simulation stub: Would run Verilator here.")
+    return True
+
+async def verify_verilog_async(verilog_text: str, sem: asyncio.Semaphore) -> bool:
+    """Async verify: Yosys runs while the event loop generates other seeds."""
+    async with sem:
+        proc = await asyncio.create_subprocess_exec(
+            'yosys', '-p', _verify_script(verilog_text),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        await proc.communicate()
+    return proc.returncode == 0
+
+def verify_many(verilog_texts: List[str]) -> List[bool]:
+    """Verify a batch of candidates with overlapping Yosys processes.
+
+    Yosys spends its time in its own parser/synth work, so overlapping up to
+    os.cpu_count() processes hides that latency behind Python-side
+    generation; results come back in input order.
+    """
+    async def run_all():
+        sem = asyncio.Semaphore(os.cpu_count() or 1)
+        return await asyncio.gather(
+            *[verify_verilog_async(text, sem) for text in verilog_texts])
+    return list(asyncio.run(run_all()))
+
+class YosysSession:
+    """Long-lived Yosys process for verifying many candidates.
+
+    Spawning yosys costs a few hundred milliseconds of startup; a sweep
+    verifying thousands of candidates amortizes that by keeping one process
+    alive and streaming per-candidate scripts over its stdin, reading output
+    back up to a sentinel log line. Yosys aborts the whole process on a
+    script error, so a failed candidate triggers a respawn for the next one.
+    """
+
+    _SENTINEL = '__YOSYS_DONE__'
+
+    def __init__(self):
+        self._proc = None
+        self._spawn()
+
+    def _spawn(self):
+        self._proc = subprocess.Popen(['yosys'], stdin=subprocess.PIPE,
+                                      stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL,
+                                      text=True, bufsize=1)
+        self._drain()  # swallow the startup banner
+
+    def _drain(self) -> Tuple[str, bool]:
+        """Read stdout up to the sentinel; returns (output, completed)."""
+        try:
+            self._proc.stdin.write(f'log {self._SENTINEL}\n')
+            self._proc.stdin.flush()
+        except (BrokenPipeError, OSError):
+            return '', False
+        lines = []
+        for line in self._proc.stdout:
+            if self._SENTINEL in line:
+                return ''.join(lines), True
+            lines.append(line)
+        return ''.join(lines), False
+
+    def verify(self, verilog_text: str) -> bool:
+        """Verify one candidate; same checks as verify_verilog, no respawn cost."""
+        if self._proc.poll() is not None:
+            self._spawn()
+        script = ('design -reset\nread_verilog <<EOT\n' + verilog_text + '\nEOT\n'
+                  'hierarchy -check -top micro_x86_core\n'
+                  'synth -top micro_x86_core\nabc\nstat\n')
+        try:
+            self._proc.stdin.write(script)
+            self._proc.stdin.flush()
+        except (BrokenPipeError, OSError):
+            self._spawn()
+            log.warning("Verification failed.")
             return False
-        
-        # Simulation stub (requires test program)
-        # subprocess.run(['verilator', '--cc', verilog_file, '--exe', 'test.cpp'], check=True)
-        print("Simulation stub: Would run Verilator here.")
+        output, completed = self._drain()
+        if not completed:
+            self._spawn()
+            log.warning("Verification failed.")
+            return False
+        log.info("Syntax check passed.")
+        log.debug("Synthesis: %s", output)
         return True
-    except subprocess.CalledProcessError:
-        print("Verification failed.")
-        return False
+
+    def close(self):
+        if self._proc is not None and self._proc.poll() is None:
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+            self._proc.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 def generate_assembler(params: Dict[str, Any]) -> str:
     """Generate simple assembler for micro-x86-64."""
@@ -401,25 +552,34 @@ def assemble(line):
     return assembler_code
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     if len(sys.argv) < 2:
         print("Usage: python cpu_babel_generator.py <seed> [query_words...]")
+        print("       python cpu_babel_generator.py --pregenerate [output_dir]")
         sys.exit(1)
-    
+
+    if sys.argv[1] == '--pregenerate':
+        output_dir = sys.argv[2] if len(sys.argv) > 2 else '.'
+        pregenerate_all(output_dir)
+        return
+
     seed = sys.argv[1]
     query_words = sys.argv[2:] if len(sys.argv) > 2 else []
     
     params = seed_to_params(seed)
     print("Generated params:", params)
     
-    verilog_file = generate_top_level_verilog(params)
-    
+    verilog_text, verilog_file = generate_top_level_verilog(params)
+
     if query_words:
         # Example seeds for search
         example_seeds = [f"seed_{i}" for i in range(10)]
         matches = similarity_search(example_seeds, query_words)
         print("Search results:", matches)
-    
-    verify = verify_verilog(verilog_file)
+
+    with YosysSession() as session:
+        verify = session.verify(verilog_text)
     if verify:
         print("Core verified successfully.")
     